@@ -1,20 +1,25 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, constr
 from typing import Optional, List
+import functools
 import logging
+import os
+import orjson
 
 from core.logic_loader import (
     load_email_logic,
+    build_path_index,
     find_child_by_label,
 )
 from core.intent_engine import IntentEngine
 from core.intent_state import IntentState
 
-# Configure logging
+# Configure logging (per-request INFO logs are off unless LOG_LEVEL=INFO)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -22,12 +27,34 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Corelytics API",
     description="AI-powered email generation engine",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+# MIDDLEWARE
+
+class CORSExemptMiddleware:
+    """
+    Pure ASGI wrapper that applies CORS to every path except the exempt ones.
+    Health checks don't need CORS, so they skip it entirely.
+    """
+
+    def __init__(self, app, exempt_paths=(), **cors_options):
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        await self.cors(scope, receive, send)
+
+
 # CORS Configuration
 app.add_middleware(
-    CORSMiddleware,
+    CORSExemptMiddleware,
+    exempt_paths=("/", "/health"),
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
@@ -38,20 +65,25 @@ app.add_middleware(
 # Load data
 try:
     EMAIL_TREE = load_email_logic()
+    FLAT_INDEX = build_path_index(EMAIL_TREE)
     engine = IntentEngine()
     logger.info("✓ Email logic loaded successfully")
-    logger.info(f"✓ Available domains: {[c['label'] for c in EMAIL_TREE['children']]}")
+    logger.info("✓ Available domains: %s", EMAIL_TREE["_labels"])
 except Exception as e:
-    logger.error(f"✗ Failed to load email logic: {e}")
+    logger.error("✗ Failed to load email logic: %s", e)
     raise
 
 
 # MODELS
 
+# Required text fields: surrounding whitespace is dropped, empty is rejected
+RequiredText = constr(min_length=1, strip_whitespace=True)
+
+
 class GenerateRequest(BaseModel):
-    domain: str
-    recipient: str
-    category: str
+    domain: RequiredText
+    recipient: RequiredText
+    category: RequiredText
     scenario: Optional[str] = None  # Make scenario optional
 
 
@@ -62,20 +94,87 @@ class ErrorResponse(BaseModel):
 
 # UTILITIES
 
-def find_node_in_children(node, label):
+@functools.lru_cache(maxsize=4096)
+def _resolve(domain, recipient=None, category=None, scenario=None):
+    """
+    Look up each level of a label path in FLAT_INDEX.
+    Cached, since EMAIL_TREE never changes after load.
+
+    Returns:
+        tuple: (domain, recipient, category, scenario) nodes; a level is
+               None if it was not requested or could not be matched
+    """
+    d = FLAT_INDEX.get((domain,))
+    r = FLAT_INDEX.get((domain, recipient)) if recipient is not None else None
+    c = (
+        FLAT_INDEX.get((domain, recipient, category))
+        if category is not None else None
+    )
+    s = (
+        FLAT_INDEX.get((domain, recipient, category, scenario))
+        if scenario is not None else None
+    )
+    return d, r, c, s
+
+
+def resolve_path(domain, recipient=None, category=None, scenario=None):
     """
-    Search for a node with exact label match in children.
-    Handles whitespace and special characters.
+    Resolve a label path through the tree.
+    Inputs are stripped here so equivalent paths share one cache entry.
     """
-    if not node or "children" not in node:
-        return None
+    return _resolve(
+        domain.strip(),
+        recipient.strip() if recipient is not None else None,
+        category.strip() if category is not None else None,
+        scenario.strip() if scenario is not None else None,
+    )
 
-    children = node.get("children", [])
-    for child in children:
-        if child.get("label", "").strip() == label.strip():
-            return child
 
-    return None
+# Navigation payloads are pre-serialized; EMAIL_TREE never changes after
+# load, so the bytes for a given set of query params never change either.
+
+_DOMAINS_JSON = orjson.dumps({
+    "status": "success",
+    "data": EMAIL_TREE["_labels"],
+    "count": len(EMAIL_TREE["_labels"])
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _recipients_json(domain):
+    d, _, _, _ = resolve_path(domain)
+    return orjson.dumps({
+        "status": "success",
+        "data": d["_labels"],
+        "count": len(d["_labels"]),
+        "domain": domain
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _categories_json(domain, recipient):
+    _, r, _, _ = resolve_path(domain, recipient)
+    return orjson.dumps({
+        "status": "success",
+        "data": r["_labels"],
+        "count": len(r["_labels"]),
+        "domain": domain,
+        "recipient": recipient
+    })
+
+
+@functools.lru_cache(maxsize=4096)
+def _scenarios_json(domain, recipient, category):
+    _, _, c, _ = resolve_path(domain, recipient, category)
+    return orjson.dumps({
+        "status": "success",
+        "data": c["_labels"],
+        "count": len(c["_labels"]),
+        "domain": domain,
+        "recipient": recipient,
+        "category": category,
+        "hasScenarios": len(c["_labels"]) > 0
+    })
 
 
 def has_scenarios(category_node):
@@ -115,15 +214,9 @@ def health():
 def get_domains():
     """Get all available domains"""
     try:
-        domains = [c["label"] for c in EMAIL_TREE.get("children", [])]
-        logger.info(f"✓ Returning {len(domains)} domains")
-        return {
-            "status": "success",
-            "data": domains,
-            "count": len(domains)
-        }
+        return Response(content=_DOMAINS_JSON, media_type="application/json")
     except Exception as e:
-        logger.error(f"✗ Error fetching domains: {e}")
+        logger.error("✗ Error fetching domains: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch domains"
@@ -133,42 +226,28 @@ def get_domains():
 # RECIPIENTS
 
 @app.get("/recipients", tags=["Navigation"])
-def get_recipients(domain: str):
+def get_recipients(domain: str = Query(..., min_length=1, pattern=r"\S")):
     """Get recipients for a specific domain"""
-    if not domain or not domain.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="Domain parameter is required"
-        )
-
     try:
-        logger.info(f"→ Searching for domain: '{domain}'")
-
         # Find domain in root children
-        d = find_node_in_children(EMAIL_TREE, domain)
+        d, _, _, _ = resolve_path(domain)
 
         if not d:
-            available = [c["label"] for c in EMAIL_TREE.get("children", [])]
-            logger.error(f"✗ Domain '{domain}' not found")
-            logger.error(f"  Available: {available}")
+            available = EMAIL_TREE["_labels"]
+            logger.warning("✗ Domain '%s' not found", domain)
             raise HTTPException(
                 status_code=404,
                 detail=f"Domain '{domain}' not found. Available domains: {', '.join(available)}"
             )
 
-        recipients = [c["label"] for c in d.get("children", [])]
-        logger.info(f"✓ Found {len(recipients)} recipients for domain '{domain}'")
-
-        return {
-            "status": "success",
-            "data": recipients,
-            "count": len(recipients),
-            "domain": domain
-        }
+        return Response(
+            content=_recipients_json(domain),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"✗ Error fetching recipients: {e}", exc_info=True)
+        logger.error("✗ Error fetching recipients: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch recipients"
@@ -178,51 +257,39 @@ def get_recipients(domain: str):
 # CATEGORIES
 
 @app.get("/categories", tags=["Navigation"])
-def get_categories(domain: str, recipient: str):
+def get_categories(
+    domain: str = Query(..., min_length=1, pattern=r"\S"),
+    recipient: str = Query(..., min_length=1, pattern=r"\S"),
+):
     """Get categories for a specific domain and recipient"""
-    if not domain or not recipient:
-        raise HTTPException(
-            status_code=400,
-            detail="Domain and recipient parameters are required"
-        )
-
     try:
-        logger.info(f"→ Searching: domain='{domain}', recipient='{recipient}'")
+        d, r, _, _ = resolve_path(domain, recipient)
 
-        # Find domain
-        d = find_node_in_children(EMAIL_TREE, domain)
+        # Check domain
         if not d:
-            logger.error(f"✗ Domain '{domain}' not found")
+            logger.warning("✗ Domain '%s' not found", domain)
             raise HTTPException(
                 status_code=404,
                 detail=f"Domain '{domain}' not found"
             )
 
-        # Find recipient
-        r = find_node_in_children(d, recipient)
+        # Check recipient
         if not r:
-            available = [c["label"] for c in d.get("children", [])]
-            logger.error(f"✗ Recipient '{recipient}' not found in domain '{domain}'")
-            logger.error(f"  Available: {available}")
+            available = d["_labels"]
+            logger.warning("✗ Recipient '%s' not found in domain '%s'", recipient, domain)
             raise HTTPException(
                 status_code=404,
                 detail=f"Recipient '{recipient}' not found in domain '{domain}'. Available: {', '.join(available)}"
             )
 
-        categories = [c["label"] for c in r.get("children", [])]
-        logger.info(f"✓ Found {len(categories)} categories")
-
-        return {
-            "status": "success",
-            "data": categories,
-            "count": len(categories),
-            "domain": domain,
-            "recipient": recipient
-        }
+        return Response(
+            content=_categories_json(domain, recipient),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"✗ Error fetching categories: {e}", exc_info=True)
+        logger.error("✗ Error fetching categories: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch categories"
@@ -232,65 +299,51 @@ def get_categories(domain: str, recipient: str):
 # SCENARIOS
 
 @app.get("/scenarios", tags=["Navigation"])
-def get_scenarios(domain: str, recipient: str, category: str):
+def get_scenarios(
+    domain: str = Query(..., min_length=1, pattern=r"\S"),
+    recipient: str = Query(..., min_length=1, pattern=r"\S"),
+    category: str = Query(..., min_length=1, pattern=r"\S"),
+):
     """
     Get scenarios for a specific domain, recipient, and category.
     Returns empty array if category has no child scenarios.
     """
-    if not all([domain, recipient, category]):
-        raise HTTPException(
-            status_code=400,
-            detail="Domain, recipient, and category parameters are required"
-        )
-
     try:
-        logger.info(f"→ Searching: domain='{domain}', recipient='{recipient}', category='{category}'")
+        d, r, c, _ = resolve_path(domain, recipient, category)
 
-        # Find domain
-        d = find_node_in_children(EMAIL_TREE, domain)
+        # Check domain
         if not d:
-            logger.error(f"✗ Domain '{domain}' not found")
+            logger.warning("✗ Domain '%s' not found", domain)
             raise HTTPException(
                 status_code=404,
                 detail=f"Domain '{domain}' not found"
             )
 
-        # Find recipient
-        r = find_node_in_children(d, recipient)
+        # Check recipient
         if not r:
-            logger.error(f"✗ Recipient '{recipient}' not found")
+            logger.warning("✗ Recipient '%s' not found", recipient)
             raise HTTPException(
                 status_code=404,
                 detail=f"Recipient '{recipient}' not found"
             )
 
-        # Find category
-        c = find_node_in_children(r, category)
+        # Check category
         if not c:
-            available = [x["label"] for x in r.get("children", [])]
-            logger.error(f"✗ Category '{category}' not found")
-            logger.error(f"  Available: {available}")
+            available = r["_labels"]
+            logger.warning("✗ Category '%s' not found", category)
             raise HTTPException(
                 status_code=404,
                 detail=f"Category '{category}' not found. Available: {', '.join(available)}"
             )
 
-        scenarios = [s["label"] for s in c.get("children", [])]
-        logger.info(f"✓ Found {len(scenarios)} scenarios (may be 0 if leaf node)")
-
-        return {
-            "status": "success",
-            "data": scenarios,
-            "count": len(scenarios),
-            "domain": domain,
-            "recipient": recipient,
-            "category": category,
-            "hasScenarios": len(scenarios) > 0
-        }
+        return Response(
+            content=_scenarios_json(domain, recipient, category),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"✗ Error fetching scenarios: {e}", exc_info=True)
+        logger.error("✗ Error fetching scenarios: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch scenarios"
@@ -300,27 +353,20 @@ def get_scenarios(domain: str, recipient: str, category: str):
 # GENERATE
 
 @app.post("/generate", tags=["Generation"])
-def generate(request: GenerateRequest):
+async def generate(request: GenerateRequest):
     """
     Generate an email based on the provided parameters.
     Scenario is optional - if not provided, uses category as scenario.
     """
 
     try:
-        if not all([request.domain, request.recipient, request.category]):
-            raise HTTPException(
-                status_code=400,
-                detail="Domain, recipient, and category are required. Scenario is optional."
-            )
-
         # If scenario is not provided, use category as scenario
         scenario = request.scenario or request.category
 
-        logger.info(f"→ Generating email:")
-        logger.info(f"  Domain: {request.domain}")
-        logger.info(f"  Recipient: {request.recipient}")
-        logger.info(f"  Category: {request.category}")
-        logger.info(f"  Scenario: {scenario}")
+        logger.info(
+            "→ Generating email: domain=%s, recipient=%s, category=%s, scenario=%s",
+            request.domain, request.recipient, request.category, scenario,
+        )
 
         state = IntentState()
         state.domain = request.domain
@@ -328,24 +374,22 @@ def generate(request: GenerateRequest):
         state.category = request.category
         state.scenario = scenario
 
-        # Navigate tree
-        d = find_node_in_children(EMAIL_TREE, request.domain)
+        # Navigate tree (scenario node is looked up only if one was given)
+        d, r, c, scenario_node = resolve_path(
+            request.domain,
+            request.recipient,
+            request.category,
+            request.scenario or None,
+        )
         if not d:
             raise HTTPException(status_code=404, detail=f"Domain not found")
 
-        r = find_node_in_children(d, request.recipient)
         if not r:
             raise HTTPException(status_code=404, detail=f"Recipient not found")
 
-        c = find_node_in_children(r, request.category)
         if not c:
             raise HTTPException(status_code=404, detail=f"Category not found")
 
-        # Try to find scenario node
-        scenario_node = None
-        if request.scenario:
-            scenario_node = find_node_in_children(c, request.scenario)
-
         # Extract metadata from scenario node or category node
         if scenario_node and "meta" in scenario_node:
             state.scenario_meta = scenario_node.get("meta", {})
@@ -358,7 +402,7 @@ def generate(request: GenerateRequest):
             state.scenario_meta = {}
 
         # Generate email
-        email_content = engine.generate(state)
+        email_content = await engine.generate(state)
 
         if not email_content:
             logger.error("✗ Failed to generate email content")
@@ -385,7 +429,7 @@ def generate(request: GenerateRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"✗ Error generating email: {e}", exc_info=True)
+        logger.error("✗ Error generating email: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate email: {str(e)}"
@@ -406,9 +450,31 @@ async def http_exception_handler(request, exc):
     )
 
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc):
+    errors = exc.errors()
+    if any(err["type"] == "json_invalid" for err in errors):
+        detail = "Invalid JSON body"
+    else:
+        # loc ends in a field name; skip positional parts such as list indexes
+        fields = ", ".join(
+            err["loc"][-1] for err in errors if isinstance(err["loc"][-1], str)
+        )
+        detail = f"Missing or invalid parameters: {fields}"
+
+    return JSONResponse(
+        status_code=400,
+        content={
+            "status": "error",
+            "detail": detail,
+            "status_code": 400
+        },
+    )
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    logger.error(f"✗ Unhandled exception: {exc}", exc_info=True)
+    logger.error("✗ Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={
@@ -1,6 +1,11 @@
+import asyncio
+
 from core.prompt_compiler import PromptCompiler
 from core.llm_service import LLMService
 
+# Upper bound on simultaneous requests sent to the LLM provider
+MAX_CONCURRENT_LLM_CALLS = 8
+
 
 class IntentEngine:
     """
@@ -12,11 +17,16 @@ class IntentEngine:
         """Initialize the intent engine."""
         self.compiler = PromptCompiler()
         self.llm_service = LLMService()
+        self._in_flight = {}
+        self._llm_semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
 
-    def generate(self, state):
+    async def generate(self, state):
         """
         Generate email content based on the provided intent state.
 
+        Concurrent calls that compile to the same brief share a single
+        in-flight LLM request.
+
         Args:
             state (IntentState): The intent state object containing domain,
                                  recipient, category, scenario, and metadata
@@ -31,10 +41,22 @@ class IntentEngine:
             # Compile the intent brief from the state
             brief = self.compiler.compile_intent_brief(state)
 
-            # Generate content using LLM service
-            email_content = self.llm_service.generate(brief)
+            # Join an identical request that is already running, if any
+            task = self._in_flight.get(brief)
+            if task is None:
+                task = asyncio.ensure_future(self._call_llm(brief))
+                self._in_flight[brief] = task
+                task.add_done_callback(lambda _: self._in_flight.pop(brief, None))
+
+            # Shield so one cancelled caller doesn't cancel the shared call
+            email_content = await asyncio.shield(task)
 
             return email_content
 
         except Exception as e:
-            raise Exception(f"Failed to generate email: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to generate email: {str(e)}")
+
+    async def _call_llm(self, brief):
+        """Generate content using LLM service, bounded by the semaphore."""
+        async with self._llm_semaphore:
+            return await self.llm_service.generate(brief)
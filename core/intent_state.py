@@ -1,16 +1,19 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True, eq=False)
 class IntentState:
     """
     Represents the state of an email generation intent.
     Tracks selections through the domain > recipient > category > scenario hierarchy.
     """
 
-    def __init__(self):
-        """Initialize an empty intent state."""
-        self.domain = None
-        self.recipient = None
-        self.category = None
-        self.scenario = None
-        self.scenario_meta = {}
+    domain: Optional[str] = None
+    recipient: Optional[str] = None
+    category: Optional[str] = None
+    scenario: Optional[str] = None
+    scenario_meta: dict = field(default_factory=dict)
 
     def summary(self):
         """
@@ -19,12 +22,7 @@ class IntentState:
         Returns:
             str: Intent path in format "Domain → Recipient → Category → Scenario"
         """
-        parts = [
-            self.domain,
-            self.recipient,
-            self.category,
-            self.scenario
-        ]
+        parts = (self.domain, self.recipient, self.category, self.scenario)
         return " → ".join([p for p in parts if p])
 
     def is_complete(self):
@@ -49,4 +47,4 @@ class IntentState:
             "category": self.category,
             "scenario": self.scenario,
             "meta": self.scenario_meta
-        }
\ No newline at end of file
+        }
@@ -1,7 +1,8 @@
 import os
 import logging
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -12,9 +13,15 @@ if not api_key:
     logger.error("✗ OPENAI_API_KEY not found in .env")
     raise RuntimeError("OPENAI_API_KEY not found in .env")
 
-client = OpenAI(api_key=api_key)
+aclient = AsyncOpenAI(api_key=api_key)
 logger.info("✓ OpenAI client initialized")
 
+# Optional reuse of generated emails for identical briefs. Off by default:
+# with temperature 0.9 each Generate click should produce a fresh draft, so
+# only enable this (LLM_CACHE_TTL seconds) to absorb quick retries.
+cache_ttl = int(os.getenv("LLM_CACHE_TTL", "0"))
+response_cache = TTLCache(maxsize=1024, ttl=cache_ttl) if cache_ttl > 0 else None
+
 
 class LLMService:
     """
@@ -23,7 +30,7 @@ class LLMService:
     """
 
     @staticmethod
-    def generate(intent_brief: str) -> str:
+    async def generate(intent_brief: str) -> str:
         """
         Generate email content using OpenAI API.
 
@@ -33,10 +40,16 @@ class LLMService:
         Returns:
             str: Generated email content
         """
+        if response_cache is not None:
+            cached = response_cache.get(intent_brief)
+            if cached is not None:
+                logger.info("✓ Returning cached email for identical brief")
+                return cached
+
         try:
             logger.info("→ Requesting email generation from OpenAI")
 
-            response = client.chat.completions.create(
+            response = await aclient.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -61,14 +74,16 @@ class LLMService:
 
             content = response.choices[0].message.content
             logger.info("✓ Email generated successfully")
+            if content and response_cache is not None:
+                response_cache[intent_brief] = content
             return content
 
         except Exception as e:
-            logger.error(f"✗ LLM generation failed: {str(e)}", exc_info=True)
+            logger.error("✗ LLM generation failed: %s", e, exc_info=True)
             return f"LLM ERROR: {str(e)}"
 
 
-def generate_email(intent_brief: str) -> str:
+async def generate_email(intent_brief: str) -> str:
     """
     Wrapper function used by FastAPI.
 
@@ -78,4 +93,4 @@ def generate_email(intent_brief: str) -> str:
     Returns:
         str: Generated email content
     """
-    return LLMService.generate(intent_brief)
\ No newline at end of file
+    return await LLMService.generate(intent_brief)
\ No newline at end of file
@@ -1,6 +1,10 @@
 import json
 import os
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -10,11 +14,12 @@ def load_email_logic():
     Load the email logic tree from JSON file.
 
     Returns:
-        dict: The email logic tree structure
+        MappingProxyType: The email logic tree structure (read-only)
 
     Raises:
         FileNotFoundError: If email_logic_map.json is not found
-        json.JSONDecodeError: If JSON is invalid
+        json.JSONDecodeError: If JSON is invalid (orjson's decode error
+            subclasses it)
     """
     try:
         base_dir = os.path.dirname(os.path.dirname(__file__))
@@ -25,31 +30,142 @@ def load_email_logic():
                 f"email_logic_map.json not found at: {json_path}"
             )
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # An empty file also raises orjson.JSONDecodeError, handled below
+        with open(json_path, "rb") as f:
+            data = orjson.loads(f.read())
+
+        data = freeze_tree(data)
+        data = MappingProxyType({
+            **data,
+            "_id_index": MappingProxyType(build_id_index(data)),
+            "_label_paths": MappingProxyType(build_label_paths(data)),
+        })
 
-        logger.info(f"✓ Loaded email logic from {json_path}")
+        logger.info("✓ Loaded email logic from %s", json_path)
         return data
 
     except FileNotFoundError as e:
-        logger.error(f"✗ {e}")
+        logger.error("✗ %s", e)
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"✗ Invalid JSON in email_logic_map.json: {e}")
+        logger.error("✗ Invalid JSON in email_logic_map.json: %s", e)
         raise
 
 
+def freeze_tree(node):
+    """
+    Build a read-only, indexed copy of the tree.
+
+    Every node becomes a MappingProxyType with its children stored as a
+    tuple. Each node also gets an "_index" mapping its children's stripped
+    labels to the child nodes, so lookups don't scan the children list,
+    and a "_labels" tuple of its children's labels in order.
+
+    Args:
+        node (dict): Root node of the tree as loaded from JSON
+
+    Returns:
+        MappingProxyType: Frozen root node
+    """
+    children = tuple(freeze_tree(child) for child in node.get("children", []))
+    index = {}
+    for child in children:
+        # First match wins, same as a linear scan would
+        index.setdefault(child.get("label", "").strip(), child)
+
+    frozen = dict(node)
+    if "children" in node:
+        frozen["children"] = children
+    if "meta" in node:
+        frozen["meta"] = MappingProxyType(dict(node["meta"]))
+    frozen["_index"] = MappingProxyType(index)
+    frozen["_labels"] = tuple(child["label"] for child in children)
+    return MappingProxyType(frozen)
+
+
+def build_path_index(root):
+    """
+    Flatten the tree into a single lookup keyed by label path.
+
+    Keys are tuples of stripped labels below the root, e.g.
+    ("Healthcare",) or ("Healthcare", "Doctor", "Appointment"). Paths
+    follow each node's "_index", so duplicate labels resolve exactly as
+    a step-by-step lookup would.
+
+    Args:
+        root: Frozen root node (see freeze_tree)
+
+    Returns:
+        dict: Mapping of label-path tuples to nodes
+    """
+    paths = {}
+
+    def walk(node, prefix):
+        for label, child in node["_index"].items():
+            path = prefix + (label,)
+            paths[path] = child
+            walk(child, path)
+
+    walk(root, ())
+    return paths
+
+
+def build_id_index(root):
+    """
+    Map every node id below the root to its node.
+
+    Args:
+        root: Frozen root node (see freeze_tree)
+
+    Returns:
+        dict: Mapping of ids to nodes; first match in pre-order wins
+    """
+    ids = {}
+
+    def walk(node):
+        for child in node.get("children", []):
+            if "id" in child:
+                ids.setdefault(child["id"], child)
+            walk(child)
+
+    walk(root)
+    return ids
+
+
+def build_label_paths(root):
+    """
+    Map every stripped label in the tree to its path from the root.
+
+    Args:
+        root: Frozen root node (see freeze_tree)
+
+    Returns:
+        dict: Mapping of stripped labels to tuples of labels from the root
+              to that node; first match in pre-order wins
+    """
+    paths = {}
+
+    def walk(node, prefix):
+        path = prefix + (node.get("label", ""),)
+        paths.setdefault(node.get("label", "").strip(), path)
+        for child in node.get("children", []):
+            walk(child, path)
+
+    walk(root, ())
+    return paths
+
+
 def get_children(node):
     """
     Get children from a node.
 
     Args:
-        node: Node object (dict) or list
+        node: Node object (mapping) or list
 
     Returns:
-        list: List of children, empty list if none
+        tuple: Children of the node, empty if none
     """
-    if isinstance(node, dict):
+    if isinstance(node, Mapping):
         return node.get("children", [])
     return []
 
@@ -59,12 +175,12 @@ def get_labels(nodes):
     Extract labels from a list of nodes.
 
     Args:
-        nodes (list): List of node dictionaries
+        nodes (list | tuple): Sequence of node mappings
 
     Returns:
         list: List of label strings
     """
-    if isinstance(nodes, list):
+    if isinstance(nodes, (list, tuple)):
         return [node.get("label", "") for node in nodes if node.get("label")]
     return []
 
@@ -75,16 +191,18 @@ def find_child_by_label(node, label):
     Handles whitespace and special characters.
 
     Args:
-        node: Parent node (dict or list)
+        node: Parent node (mapping, list or tuple)
         label (str): Label to search for
 
     Returns:
-        dict: Child node if found, None otherwise
+        Mapping: Child node if found, None otherwise
     """
-    if isinstance(node, dict):
+    if isinstance(node, Mapping):
+        if "_index" in node:
+            return node["_index"].get(label.strip())
         node = node.get("children", [])
 
-    if not isinstance(node, list):
+    if not isinstance(node, (list, tuple)):
         return None
 
     for child in node:
@@ -97,20 +215,30 @@ def find_child_by_label(node, label):
 def find_node_by_id(node, node_id):
     """
     Find a node by its ID (for future use).
+    Uses the root's "_id_index" when available, otherwise searches.
 
     Args:
         node: Node to search in
         node_id (str): ID to search for
 
     Returns:
-        dict: Node if found, None otherwise
+        Mapping: Node if found, None otherwise
     """
     if node.get("id") == node_id:
         return node
 
-    children = node.get("children", [])
-    for child in children:
-        result = find_node_by_id(child, node_id)
+    if "_id_index" in node:
+        return node["_id_index"].get(node_id)
+
+    return _search_by_id(node, node_id)
+
+
+def _search_by_id(node, node_id):
+    """Recursive fallback for subtrees without an id index."""
+    for child in node.get("children", []):
+        if child.get("id") == node_id:
+            return child
+        result = _search_by_id(child, node_id)
         if result:
             return result
 
@@ -120,6 +248,7 @@ def find_node_by_id(node, node_id):
 def get_node_path(root, target_label):
     """
     Get the path to a node from root.
+    Uses the root's "_label_paths" when available, otherwise searches.
 
     Args:
         root: Root node
@@ -128,17 +257,21 @@ def get_node_path(root, target_label):
     Returns:
         list: Path of labels from root to target, empty if not found
     """
+    if "_label_paths" in root:
+        return list(root["_label_paths"].get(target_label.strip(), ()))
 
-    def search(node, path):
-        if node.get("label", "").strip() == target_label.strip():
-            return path + [node.get("label", "")]
+    return list(_search_label_path(root, target_label.strip(), ()) or ())
 
-        for child in node.get("children", []):
-            result = search(child, path + [node.get("label", "")])
-            if result:
-                return result
 
-        return None
+def _search_label_path(node, target_label, path):
+    """Recursive fallback for subtrees without a label path index."""
+    path = path + (node.get("label", ""),)
+    if node.get("label", "").strip() == target_label:
+        return path
 
-    result = search(root, [])
-    return result or []
\ No newline at end of file
+    for child in node.get("children", []):
+        result = _search_label_path(child, target_label, path)
+        if result:
+            return result
+
+    return None
@@ -4,11 +4,91 @@ High-realism behavioral brief generator.
 Designed to suppress generic AI patterns and enforce situational authenticity.
 """
 
+import functools
 import logging
+from typing import Final
 
 logger = logging.getLogger(__name__)
 
 
+# ---------- Static Prompt Blocks ---------- #
+
+_ARCHETYPE_GUIDANCE: Final[dict[str, str]] = {
+    "Accountability / Apology":
+        "Acknowledge responsibility clearly. Avoid defensiveness. Show corrective intent.",
+    "Clarification Seeking":
+        "Specify exactly what is unclear. Show that effort was already made.",
+    "Direct Request":
+        "State the request early. Avoid excessive justification.",
+    "Problem Reporting":
+        "Describe the issue factually. Avoid emotional exaggeration.",
+    "Status Update":
+        "Summarize current status efficiently. Highlight next steps.",
+    "Opportunity Pitch":
+        "Avoid hype. Be grounded. Show strategic relevance to the recipient.",
+    "Personal Scheduling Request":
+        "Be practical. Mention availability windows realistically.",
+    "Professional Communication":
+        "Be clear, purposeful, and context-aware."
+}
+
+_URGENCY_GUIDANCE: Final[dict[str, str]] = {
+    "high": "There is time sensitivity. Reflect urgency respectfully without sounding panicked.",
+    "low": "There is no urgency. Keep the tone calm and unpressured.",
+    "normal": "Normal professional urgency."
+}
+
+_HEADER: Final[str] = (
+    "You are writing a real email as a real person in a real situation.\n"
+    "\n"
+    "You are NOT an AI.\n"
+    "You are NOT generating a template.\n"
+    "You are NOT writing a textbook example."
+)
+
+_DEFAULT_CONTEXT: Final[str] = "The situation is practical and real, not hypothetical."
+
+_STRUCTURAL: Final[str] = (
+    "Structural Expectations:\n"
+    "- Include a subject line\n"
+    "- Use 3–4 meaningful paragraphs\n"
+    "- Each paragraph must add new information\n"
+    "- End with a natural sign-off appropriate to the context\n"
+    "- Do NOT use placeholders like [Your Name]\n"
+    "- Do NOT overexplain\n"
+    "- Do NOT repeat labels like domain or category\n"
+    "- Do NOT sound polished to the point of artificiality"
+)
+
+_FOOTER: Final[str] = "Write the complete email now."
+
+_SPECIFICITY_BLOCK: Final[str] = """
+Specificity Requirement:
+- Include at least one concrete detail (timeframe, example, constraint, or prior action taken)
+- Avoid vague phrases like "recently", "exciting opportunity", "some concerns"
+- Replace general claims with grounded statements
+"""
+
+_ANTI_GENERIC_BLOCK: Final[str] = """
+Forbidden Generic Phrases:
+- "I hope this message finds you well"
+- "This email is regarding"
+- "I would like to bring to your attention"
+- "Exciting opportunity"
+- "Kindly do the needful"
+- Overly polished marketing language
+
+If a sentence sounds like a template, rewrite it.
+"""
+
+_EMBODIMENT_BLOCK: Final[str] = """
+Embodiment Instruction:
+Write from the perspective of someone who has actually experienced this situation.
+There should be mild natural imperfection in tone.
+Do not sound like a formal announcement.
+"""
+
+
 class PromptCompiler:
     """
     Converts structured intent into a psychologically grounded
@@ -27,68 +107,57 @@ class PromptCompiler:
             str: The compiled prompt brief
         """
         meta = state.scenario_meta or {}
+        brief = PromptCompiler._compile_cached(
+            state.domain,
+            state.recipient,
+            state.scenario,
+            tuple(sorted(meta.items())),
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Compiled prompt brief for: %s", state.summary())
+        return brief
 
-        intent_focus = meta.get("intent_focus", state.scenario)
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _compile_cached(domain, recipient, scenario, meta_items) -> str:
+        """
+        Build the prompt brief from hashable inputs.
+        Cached, since the brief is fully determined by these values.
+        """
+        meta = dict(meta_items)
+
+        intent_focus = meta.get("intent_focus", scenario)
         context_hint = meta.get("context_hint", "")
         pressure = meta.get("pressure", "normal")
         tone_hint = meta.get("tone_hint", "Professional and appropriate.")
 
-        archetype = PromptCompiler._infer_archetype(intent_focus, state.scenario)
+        archetype = PromptCompiler._infer_archetype(intent_focus, scenario)
         archetype_guidance = PromptCompiler._archetype_guidance(archetype)
         urgency_guidance = PromptCompiler._urgency_guidance(pressure)
         specificity_instruction = PromptCompiler._specificity_enforcement()
         anti_generic_block = PromptCompiler._anti_generic_rules()
         embodiment_block = PromptCompiler._embodiment_instruction()
 
-        brief = f"""
-You are writing a real email as a real person in a real situation.
-
-You are NOT an AI.
-You are NOT generating a template.
-You are NOT writing a textbook example.
-
-Recipient Role: {state.recipient}
-Professional Context: {state.domain}
-Situation: {state.scenario}
+        parts = (
+            _HEADER,
+            f"Recipient Role: {recipient}\n"
+            f"Professional Context: {domain}\n"
+            f"Situation: {scenario}",
+            f"Communication Archetype:\n{archetype}",
+            f"Core Purpose:\n{intent_focus}",
+            f"Context Background:\n{context_hint if context_hint else _DEFAULT_CONTEXT}",
+            f"Behavioral Guidance:\n{archetype_guidance}",
+            f"Tone Guidance:\n{tone_hint}",
+            f"Urgency Guidance:\n{urgency_guidance}",
+            embodiment_block,
+            specificity_instruction,
+            anti_generic_block,
+            _STRUCTURAL,
+            _FOOTER,
+        )
+        brief = "\n\n".join(parts)
 
-Communication Archetype:
-{archetype}
-
-Core Purpose:
-{intent_focus}
-
-Context Background:
-{context_hint if context_hint else "The situation is practical and real, not hypothetical."}
-
-Behavioral Guidance:
-{archetype_guidance}
-
-Tone Guidance:
-{tone_hint}
-
-Urgency Guidance:
-{urgency_guidance}
-
-{embodiment_block}
-
-{specificity_instruction}
-
-{anti_generic_block}
-
-Structural Expectations:
-- Include a subject line
-- Use 3–4 meaningful paragraphs
-- Each paragraph must add new information
-- End with a natural sign-off appropriate to the context
-- Do NOT use placeholders like [Your Name]
-- Do NOT overexplain
-- Do NOT repeat labels like domain or category
-- Do NOT sound polished to the point of artificiality
-
-Write the complete email now.
-""".strip()
-
-        logger.debug(f"Compiled prompt brief for: {state.summary()}")
         return brief
 
     # ---------- Archetype Logic ---------- #
@@ -117,67 +186,26 @@ Write the complete email now.
     @staticmethod
     def _archetype_guidance(archetype: str) -> str:
         """Get behavioral guidance for the archetype."""
-        mapping = {
-            "Accountability / Apology":
-                "Acknowledge responsibility clearly. Avoid defensiveness. Show corrective intent.",
-            "Clarification Seeking":
-                "Specify exactly what is unclear. Show that effort was already made.",
-            "Direct Request":
-                "State the request early. Avoid excessive justification.",
-            "Problem Reporting":
-                "Describe the issue factually. Avoid emotional exaggeration.",
-            "Status Update":
-                "Summarize current status efficiently. Highlight next steps.",
-            "Opportunity Pitch":
-                "Avoid hype. Be grounded. Show strategic relevance to the recipient.",
-            "Personal Scheduling Request":
-                "Be practical. Mention availability windows realistically.",
-            "Professional Communication":
-                "Be clear, purposeful, and context-aware."
-        }
-
-        return mapping.get(archetype, mapping["Professional Communication"])
+        return _ARCHETYPE_GUIDANCE.get(
+            archetype, _ARCHETYPE_GUIDANCE["Professional Communication"]
+        )
 
     @staticmethod
     def _urgency_guidance(pressure: str) -> str:
         """Get urgency guidance based on pressure level."""
-        if pressure == "high":
-            return "There is time sensitivity. Reflect urgency respectfully without sounding panicked."
-        if pressure == "low":
-            return "There is no urgency. Keep the tone calm and unpressured."
-        return "Normal professional urgency."
+        return _URGENCY_GUIDANCE.get(pressure, _URGENCY_GUIDANCE["normal"])
 
     @staticmethod
     def _specificity_enforcement() -> str:
         """Get specificity enforcement instructions."""
-        return """
-Specificity Requirement:
-- Include at least one concrete detail (timeframe, example, constraint, or prior action taken)
-- Avoid vague phrases like "recently", "exciting opportunity", "some concerns"
-- Replace general claims with grounded statements
-"""
+        return _SPECIFICITY_BLOCK
 
     @staticmethod
     def _anti_generic_rules() -> str:
         """Get anti-generic language rules."""
-        return """
-Forbidden Generic Phrases:
-- "I hope this message finds you well"
-- "This email is regarding"
-- "I would like to bring to your attention"
-- "Exciting opportunity"
-- "Kindly do the needful"
-- Overly polished marketing language
-
-If a sentence sounds like a template, rewrite it.
-"""
+        return _ANTI_GENERIC_BLOCK
 
     @staticmethod
     def _embodiment_instruction() -> str:
         """Get embodiment instruction."""
-        return """
-Embodiment Instruction:
-Write from the perspective of someone who has actually experienced this situation.
-There should be mild natural imperfection in tone.
-Do not sound like a formal announcement.
-"""
\ No newline at end of file
+        return _EMBODIMENT_BLOCK
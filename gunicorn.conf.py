@@ -0,0 +1,26 @@
+"""
+Gunicorn configuration for production.
+
+The app is imported once in the master (preload_app) so EMAIL_TREE and
+its indexes are built before forking; workers share those pages
+copy-on-write instead of each re-parsing the JSON.
+
+Run with: gunicorn api:app
+"""
+
+import gc
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "workers.TunedUvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+backlog = 2048
+keepalive = 5
+preload_app = True
+
+
+def when_ready(server):
+    # Move everything loaded so far out of the GC's tracking so collections
+    # in workers don't touch (and un-share) the preloaded tree's pages.
+    gc.freeze()
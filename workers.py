@@ -0,0 +1,19 @@
+"""
+Gunicorn worker classes (see gunicorn.conf.py).
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """
+    Uvicorn worker pinned to uvloop + httptools, with a concurrency cap
+    and no access log (a stdout write per request).
+    """
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "limit_concurrency": 1000,
+        "access_log": False,
+    }